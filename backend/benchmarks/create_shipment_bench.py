@@ -0,0 +1,116 @@
+# Benchmark: MongoDB commands and latency of POST /shipments
+# Drives the app's create_shipment endpoint in-process and counts the
+# commands each request sends with a pymongo CommandListener, split by
+# collection (authentication, the insert and the rollup updates).
+# Uses BENCH_MONGO_URI (e.g. a local mongod) if set, otherwise mongomock,
+# which sends no command events, so only latency is reported there.
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+import httpx
+from pymongo import monitoring
+
+BENCH_MONGO_URI = os.getenv("BENCH_MONGO_URI")
+BENCH_ITERATIONS = int(os.getenv("BENCH_ITERATIONS", 1000))
+BENCH_DB_NAME = "SCMXPertLite_bench"
+BENCH_USER = {"username": "bench_user", "email": "bench_user@example.com", "password": "bench_password", "role": "user"}
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.counts = Counter()
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        self.counts[(collection if isinstance(collection, str) else "-", event.command_name)] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def load_app():
+    if BENCH_MONGO_URI:
+        os.environ["MONGO_DETAILS"] = BENCH_MONGO_URI
+    else:
+        import motor.motor_asyncio
+        from mongomock_motor import AsyncMongoMockClient, AsyncMongoMockCollection
+
+        motor.motor_asyncio.AsyncIOMotorClient = lambda *a, **kw: AsyncMongoMockClient()
+        # mongomock has no write concerns and its with_options() returns a
+        # synchronous collection, so keep the async one
+        AsyncMongoMockCollection.with_options = lambda self, **kw: self
+    os.environ["MONGO_DB_NAME"] = BENCH_DB_NAME
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import app as app_module
+    return app_module
+
+
+def make_shipment():
+    return {
+        "item_name": "bench-item",
+        "quantity": 1,
+        "description": "benchmark shipment",
+        "status": "created",
+        "created_at": datetime.utcnow().isoformat(),
+    }
+
+
+async def main():
+    counter = CommandCounter()
+    monitoring.register(counter)  # Applies to the client the app creates below
+    app_module = load_app()
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    # Only the connection: background tasks from the lifespan would add their own commands
+    await app_module.connect_mongo()
+    try:
+        transport = httpx.ASGITransport(app=app_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await client.post("/signup", json=BENCH_USER)
+            response = await client.post("/token", data={"username": BENCH_USER["username"], "password": BENCH_USER["password"]})
+            response.raise_for_status()
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+            for _ in range(10):  # Warm up connections and caches
+                (await client.post("/shipments", json=make_shipment(), headers=headers)).raise_for_status()
+
+            counter.counts.clear()
+            samples = []
+            for _ in range(BENCH_ITERATIONS):
+                start = time.perf_counter()
+                response = await client.post("/shipments", json=make_shipment(), headers=headers)
+                samples.append(time.perf_counter() - start)
+                response.raise_for_status()
+    finally:
+        if BENCH_MONGO_URI:
+            await app_module.client.drop_database(BENCH_DB_NAME)
+        app_module.close_mongo()
+
+    samples.sort()
+    print(f"Backend: {BENCH_MONGO_URI or 'mongomock'}, iterations: {BENCH_ITERATIONS}")
+    print(
+        f"POST /shipments: p50={samples[len(samples) // 2] * 1000:.3f}ms "
+        f"p99={samples[int(len(samples) * 0.99) - 1] * 1000:.3f}ms "
+        f"mean={statistics.mean(samples) * 1000:.3f}ms"
+    )
+    if not BENCH_MONGO_URI:
+        print("Command counts need BENCH_MONGO_URI (mongomock sends no command events)")
+        return
+    print(f"MongoDB commands per request: {sum(counter.counts.values()) / BENCH_ITERATIONS:.2f}")
+    for (collection, command), count in sorted(counter.counts.items()):
+        print(f"  {collection}.{command}: {count / BENCH_ITERATIONS:.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+
+# cd SCMXPertLite/backend
+# BENCH_MONGO_URI=mongodb://localhost:27017 python benchmarks/create_shipment_bench.py
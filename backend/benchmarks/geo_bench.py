@@ -0,0 +1,133 @@
+# Benchmark: geospatial queries over tracking points and shipment positions
+# Needs a real mongod (mongomock has no geo query support):
+#   BENCH_MONGO_URI=mongodb://localhost:27017 python benchmarks/geo_bench.py
+# Seeds BENCH_POINTS tracking logs (10M by default) spread over
+# BENCH_SHIPMENTS shipments, derives each shipment's last_location the way the
+# app maintains it, then times the map queries the API runs.
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from multiprocessing import Pool
+
+from bson import ObjectId
+from pymongo import MongoClient
+
+BENCH_MONGO_URI = os.getenv("BENCH_MONGO_URI")
+BENCH_DB = os.getenv("BENCH_DB", "SCMXPertLite_geo_bench")
+BENCH_POINTS = int(os.getenv("BENCH_POINTS", 10_000_000))
+BENCH_SHIPMENTS = int(os.getenv("BENCH_SHIPMENTS", 100_000))
+BENCH_PROCESSES = int(os.getenv("BENCH_PROCESSES", os.cpu_count() or 1))
+BENCH_REPEAT = int(os.getenv("BENCH_REPEAT", 50))
+BATCH_SIZE = 10_000
+STATUSES = ["Created", "In Transit", "In Transit", "In Transit", "Delivered"]
+
+
+def seed_points(args):
+    worker, shipment_ids, count = args
+    rng = random.Random(worker)
+    db = MongoClient(BENCH_MONGO_URI)[BENCH_DB]
+    start = datetime.utcnow() - timedelta(days=30)
+    inserted = 0
+    while inserted < count:
+        batch = []
+        for _ in range(min(BATCH_SIZE, count - inserted)):
+            batch.append({
+                "shipment_id": rng.choice(shipment_ids),
+                "status": "In Transit",
+                "location": {"type": "Point", "coordinates": [rng.uniform(-180, 180), rng.uniform(-85, 85)]},
+                "timestamp": start + timedelta(seconds=rng.randrange(30 * 24 * 3600)),
+            })
+        db["shipment_tracking_logs"].insert_many(batch, ordered=False)
+        inserted += len(batch)
+    return inserted
+
+
+def seed(db):
+    print(f"Seeding {BENCH_SHIPMENTS} shipments and {BENCH_POINTS} tracking points...", file=sys.stderr)
+    db.drop_collection("shipments")
+    db.drop_collection("shipment_tracking_logs")
+    shipment_ids = [ObjectId() for _ in range(BENCH_SHIPMENTS)]
+    for i in range(0, len(shipment_ids), BATCH_SIZE):
+        db["shipments"].insert_many([
+            {"_id": shipment_id, "item_name": "bench", "user_id": f"user{n % 1000}", "status": random.choice(STATUSES)}
+            for n, shipment_id in enumerate(shipment_ids[i:i + BATCH_SIZE], start=i)
+        ], ordered=False)
+
+    start = time.perf_counter()
+    per_worker = BENCH_POINTS // BENCH_PROCESSES
+    jobs = [(w, shipment_ids, per_worker + (BENCH_POINTS % BENCH_PROCESSES if w == 0 else 0)) for w in range(BENCH_PROCESSES)]
+    with Pool(BENCH_PROCESSES) as pool:
+        total = sum(pool.map(seed_points, jobs))
+    elapsed = time.perf_counter() - start
+    print(f"Inserted {total} points in {elapsed:.1f}s ({total / elapsed:.0f} docs/s)", file=sys.stderr)
+
+    # Same indexes the app declares
+    db["shipment_tracking_logs"].create_index([("shipment_id", 1), ("timestamp", -1)])
+    db["shipment_tracking_logs"].create_index([("location", "2dsphere")])
+    db["shipments"].create_index([("last_location", "2dsphere"), ("user_id", 1)])
+    db["shipments"].create_index([("status", 1), ("user_id", 1)])
+
+    # Last known position per shipment, as add_tracking_log maintains it
+    db["shipment_tracking_logs"].aggregate([
+        {"$sort": {"shipment_id": 1, "timestamp": -1}},
+        {"$group": {"_id": "$shipment_id", "last_location": {"$first": "$location"},
+                    "last_location_at": {"$first": "$timestamp"}}},
+        {"$merge": {"into": "shipments", "on": "_id", "whenMatched": "merge", "whenNotMatched": "discard"}},
+    ], allowDiskUse=True)
+
+
+def random_point():
+    return [random.uniform(-170, 170), random.uniform(-80, 80)]
+
+
+def box(size):
+    lng, lat = random_point()
+    return {"type": "Polygon", "coordinates": [[
+        [lng, lat], [lng + size, lat], [lng + size, lat + size], [lng, lat + size], [lng, lat],
+    ]]}
+
+
+QUERIES = {
+    "tracking points within 50km": lambda db: list(db["shipment_tracking_logs"].find(
+        {"location": {"$geoWithin": {"$centerSphere": [random_point(), 50 / 6378.1]}}}, {"_id": 1}).limit(1000)),
+    "tracking points in 1deg box": lambda db: list(db["shipment_tracking_logs"].find(
+        {"location": {"$geoWithin": {"$geometry": box(1)}}}, {"_id": 1}).limit(1000)),
+    "shipments near (200km, 100 nearest)": lambda db: list(db["shipments"].find(
+        {"last_location": {"$nearSphere": {"$geometry": {"type": "Point", "coordinates": random_point()},
+                                           "$maxDistance": 200_000}}}).limit(100)),
+    "shipments in 10deg box": lambda db: list(db["shipments"].find(
+        {"last_location": {"$geoWithin": {"$geometry": box(10)}}}).limit(1000)),
+    "in-transit positions (one user)": lambda db: list(db["shipments"].find(
+        {"status": "In Transit", "user_id": f"user{random.randrange(1000)}", "last_location": {"$exists": True}})),
+}
+
+
+def main():
+    if not BENCH_MONGO_URI:
+        sys.exit("Set BENCH_MONGO_URI to a mongod instance (geo queries need a real server)")
+    db = MongoClient(BENCH_MONGO_URI)[BENCH_DB]
+    if os.getenv("BENCH_SKIP_SEED", "false").lower() != "true":
+        seed(db)
+
+    print(f"points={db['shipment_tracking_logs'].estimated_document_count()} "
+          f"shipments={db['shipments'].estimated_document_count()} repeat={BENCH_REPEAT}")
+    for name, query in QUERIES.items():
+        samples = []
+        for _ in range(BENCH_REPEAT):
+            start = time.perf_counter()
+            query(db)
+            samples.append(time.perf_counter() - start)
+        samples.sort()
+        print(f"{name}: p50={statistics.median(samples) * 1000:.2f}ms "
+              f"p99={samples[int(len(samples) * 0.99) - 1] * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
+
+# cd SCMXPertLite/backend
+# BENCH_MONGO_URI=mongodb://localhost:27017 python benchmarks/geo_bench.py
+# BENCH_MONGO_URI=mongodb://localhost:27017 BENCH_SKIP_SEED=true python benchmarks/geo_bench.py
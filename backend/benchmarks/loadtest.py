@@ -0,0 +1,317 @@
+# Load test: mixed workload against the FastAPI app, results as JSON
+# Starts the app in a subprocess against a local mongod (--mongo-uri) or an
+# in-memory mongomock stand-in, seeds users and shipments shaped like
+# db/mongo_script.py, then drives /token, /signup, /shipments and /users/me at
+# a fixed concurrency and reports throughput and p50/p95/p99 per route.
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_PASSWORD = "loadtest_password"
+DEFAULT_MIX = "token=1,signup=1,create_shipment=3,list_shipments=3,users_me=5"
+GOODS_TYPES = ["electronics", "food", "pharmaceuticals", "textiles"]
+STATUSES = ["Created", "In Transit", "Delivered"]
+
+
+def seed_username(i):
+    return f"loadtest_user_{i}"
+
+
+def make_shipment(user_id, created_at):
+    return {
+        "item_name": f"ITEM{random.randrange(10**6):06d}",
+        "quantity": random.randint(1, 100),
+        "description": "Load test shipment",
+        "status": random.choice(STATUSES),
+        "goods_type": random.choice(GOODS_TYPES),
+        "user_id": user_id,
+        "created_at": created_at,
+    }
+
+
+async def seed(db, hashed_password, users, shipments_per_user):
+    # One bcrypt hash shared by every seeded user keeps seeding fast
+    now = datetime.utcnow()
+    await db["users"].delete_many({"username": {"$regex": "^loadtest_"}})
+    await db["shipments"].delete_many({"user_id": {"$regex": "^loadtest_"}})
+    await db["users"].insert_many([
+        {
+            "username": seed_username(i),
+            "email": f"{seed_username(i)}@example.com",
+            "full_name": f"Load Test {i}",
+            "disabled": False,
+            "role": "user",
+            "hashed_password": hashed_password,
+            "created_at": now,
+        }
+        for i in range(users)
+    ])
+    for i in range(users):
+        docs = [
+            make_shipment(seed_username(i), now - timedelta(minutes=random.randrange(60 * 24 * 90)))
+            for _ in range(shipments_per_user)
+        ]
+        if docs:
+            await db["shipments"].insert_many(docs, ordered=False)
+
+
+def serve(args):
+    """Run the app (in this subprocess) with seeding hooked into startup."""
+    if not args.mongo_uri:
+        import motor.motor_asyncio
+        from mongomock_motor import AsyncMongoMockClient, AsyncMongoMockCollection
+
+        motor.motor_asyncio.AsyncIOMotorClient = lambda *a, **kw: AsyncMongoMockClient()
+        # mongomock has no write concerns and its with_options() returns a
+        # synchronous collection, so keep the async one
+        AsyncMongoMockCollection.with_options = lambda self, **kw: self
+    else:
+        os.environ["MONGO_DETAILS"] = args.mongo_uri
+        os.environ.setdefault("MONGO_DB_NAME", "SCMXPertLite_loadtest")
+    # Every simulated user logs in from 127.0.0.1, which the /token limits
+    # would turn into 429s; this measures the app, not the limiter
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+    os.chdir(BACKEND_DIR)  # The app serves frontend/static relative to here
+    sys.path.insert(0, BACKEND_DIR)
+    import uvicorn
+    import app as app_module
+
+    async def seed_on_startup():
+        hashed_password = app_module.get_password_hash(SEED_PASSWORD)
+        start = time.perf_counter()
+        await seed(app_module.db, hashed_password, args.users, args.shipments_per_user)
+        print(f"Seeded {args.users} users / {args.users * args.shipments_per_user} shipments "
+              f"in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    app_lifespan = app_module.app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan_with_seed(app):
+        async with app_lifespan(app) as state:
+            await seed_on_startup()
+            yield state
+
+    app_module.app.router.lifespan_context = lifespan_with_seed
+    uvicorn.run(app_module.app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+class Workload:
+    def __init__(self, client, users):
+        self.client = client
+        self.users = users
+        self.tokens = {}
+        self.signups = 0
+
+    def random_username(self):
+        return seed_username(random.randrange(self.users))
+
+    async def login_users(self, count):
+        # Log in up front so authenticated requests don't include a bcrypt check
+        for i in range(min(count, self.users)):
+            response = await self.token(seed_username(i))
+            response.raise_for_status()
+
+    def auth_headers(self):
+        token = random.choice(list(self.tokens.values()))
+        return {"Authorization": f"Bearer {token}"}
+
+    async def token(self, username=None):
+        username = username or self.random_username()
+        response = await self.client.post("/token", data={"username": username, "password": SEED_PASSWORD})
+        if response.status_code == 200:
+            self.tokens[username] = response.json()["access_token"]
+        return response
+
+    async def signup(self):
+        self.signups += 1
+        username = f"loadtest_signup_{os.getpid()}_{self.signups}_{random.randrange(10**9)}"
+        return await self.client.post("/signup", json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": SEED_PASSWORD,
+            "role": "user",
+        })
+
+    async def create_shipment(self, headers):
+        payload = make_shipment(None, datetime.utcnow())
+        payload.pop("user_id")
+        payload["created_at"] = payload["created_at"].isoformat()
+        return await self.client.post("/shipments", json=payload, headers=headers)
+
+    async def list_shipments(self, headers):
+        return await self.client.get("/shipments", params={"limit": 50}, headers=headers)
+
+    async def users_me(self, headers):
+        return await self.client.get("/users/me", headers=headers)
+
+    async def run(self, operation):
+        if operation == "token":
+            return await self.token()
+        if operation == "signup":
+            return await self.signup()
+        headers = self.auth_headers()
+        return await getattr(self, operation)(headers)
+
+
+def parse_mix(mix):
+    weights = {}
+    for part in mix.split(","):
+        name, weight = part.split("=")
+        weights[name.strip()] = float(weight)
+    unknown = set(weights) - {"token", "signup", "create_shipment", "list_shipments", "users_me"}
+    if unknown:
+        raise SystemExit(f"Unknown operations in --mix: {', '.join(sorted(unknown))}")
+    return weights
+
+
+def percentile(samples, pct):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def summarize(samples, errors, elapsed):
+    routes = {}
+    for operation in sorted(set(samples) | set(errors)):
+        latencies = samples.get(operation, [])
+        routes[operation] = {
+            "count": len(latencies),
+            "errors": sum(errors.get(operation, {}).values()),
+            "errors_by_status": errors.get(operation, {}),
+            "throughput_rps": round(len(latencies) / elapsed, 2),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3) if latencies else None,
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+        }
+    total = sum(route["count"] for route in routes.values())
+    return {"elapsed_seconds": round(elapsed, 3), "total_requests": total,
+            "throughput_rps": round(total / elapsed, 2), "routes": routes}
+
+
+async def drive(args):
+    weights = parse_mix(args.mix)
+    operations, cumulative = list(weights), list(weights.values())
+    samples, errors = {}, {}
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        workload = Workload(client, args.users)
+        await workload.login_users(args.logged_in_users)
+
+        async def worker(deadline, record):
+            while time.perf_counter() < deadline:
+                operation = random.choices(operations, weights=cumulative)[0]
+                start = time.perf_counter()
+                try:
+                    response = await workload.run(operation)
+                    outcome = response.status_code
+                except httpx.HTTPError as e:
+                    outcome = type(e).__name__
+                if not record:
+                    continue
+                if outcome in (200, 201):
+                    samples.setdefault(operation, []).append(time.perf_counter() - start)
+                else:
+                    by_outcome = errors.setdefault(operation, {})
+                    by_outcome[str(outcome)] = by_outcome.get(str(outcome), 0) + 1
+
+        if args.warmup > 0:
+            deadline = time.perf_counter() + args.warmup
+            await asyncio.gather(*(worker(deadline, False) for _ in range(args.concurrency)))
+
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(worker(deadline, True) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return summarize(samples, errors, elapsed)
+
+
+async def wait_until_ready(base_url, server, timeout):
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.perf_counter() < deadline:
+            if server.poll() is not None:
+                raise SystemExit("App exited during startup")
+            try:
+                await client.get("/metrics")
+                return
+            except httpx.HTTPError:
+                await asyncio.sleep(0.2)
+    raise SystemExit("App did not become ready in time")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="SCMXPertLite load test")
+    parser.add_argument("mode", nargs="?", choices=["run", "serve"], default="run")
+    parser.add_argument("--mongo-uri", help="Local mongod URI; omit to use an in-memory mongomock stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--shipments-per-user", type=int, default=100)
+    parser.add_argument("--logged-in-users", type=int, default=20, help="Users whose tokens authenticated requests use")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds before the run")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Operation weights, e.g. " + DEFAULT_MIX)
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible runs")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    random.seed(args.seed)
+    if args.mode == "serve":
+        serve(args)
+        return
+
+    args.base_url = f"http://127.0.0.1:{args.port}"
+    server_args = [sys.executable, os.path.abspath(__file__), "serve", "--port", str(args.port),
+                   "--users", str(args.users), "--shipments-per-user", str(args.shipments_per_user),
+                   "--seed", str(args.seed)]
+    if args.mongo_uri:
+        server_args += ["--mongo-uri", args.mongo_uri]
+    server = subprocess.Popen(server_args)
+    try:
+        asyncio.run(wait_until_ready(args.base_url, server, timeout=600))
+        report = asyncio.run(drive(args))
+    finally:
+        server.terminate()
+        server.wait()
+
+    report["config"] = {
+        "backend": args.mongo_uri or "mongomock",
+        "users": args.users,
+        "shipments_per_user": args.shipments_per_user,
+        "logged_in_users": args.logged_in_users,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "mix": parse_mix(args.mix),
+        "seed": args.seed,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
+
+# cd SCMXPertLite/backend
+# python benchmarks/loadtest.py --users 1000 --shipments-per-user 100 --output run.json
+# python benchmarks/loadtest.py --mongo-uri mongodb://localhost:27017 --concurrency 64
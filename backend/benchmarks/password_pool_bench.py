@@ -0,0 +1,101 @@
+# Load benchmark: /shipments latency while /token is hammered
+# Run the app first with rate limiting off (RATE_LIMIT_ENABLED=false uvicorn
+# app:app), then run this script against it; otherwise most /token calls are
+# cheap 429s instead of bcrypt work.
+import asyncio
+import os
+import statistics
+import time
+from datetime import datetime
+
+import httpx
+
+BASE_URL = os.getenv("BENCH_BASE_URL", "http://127.0.0.1:8000")
+LOGIN_CONCURRENCY = int(os.getenv("BENCH_LOGIN_CONCURRENCY", 50))
+SHIPMENT_REQUESTS = int(os.getenv("BENCH_SHIPMENT_REQUESTS", 200))
+BENCH_USER = {
+    "username": "bench_user",
+    "email": "bench_user@example.com",
+    "password": "bench_password",
+    "role": "user",
+}
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(label, samples):
+    print(
+        f"{label}: n={len(samples)} "
+        f"p50={percentile(samples, 50) * 1000:.1f}ms "
+        f"p99={percentile(samples, 99) * 1000:.1f}ms "
+        f"mean={statistics.mean(samples) * 1000:.1f}ms"
+    )
+
+
+async def get_token(client):
+    await client.post("/signup", json=BENCH_USER)
+    response = await client.post(
+        "/token", data={"username": BENCH_USER["username"], "password": BENCH_USER["password"]}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def measure_shipments(client, token):
+    headers = {"Authorization": f"Bearer {token}"}
+    samples = []
+    for i in range(SHIPMENT_REQUESTS):
+        payload = {
+            "item_name": f"bench-item-{i}",
+            "quantity": 1,
+            "description": "benchmark shipment",
+            "status": "created",
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        start = time.perf_counter()
+        response = await client.post("/shipments", json=payload, headers=headers)
+        samples.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return samples
+
+
+async def hammer_login(client, stop, rate_limited):
+    form = {"username": BENCH_USER["username"], "password": BENCH_USER["password"]}
+    while not stop.is_set():
+        response = await client.post("/token", data=form)
+        if response.status_code == 429:
+            rate_limited[0] += 1
+
+
+async def main():
+    limits = httpx.Limits(max_connections=LOGIN_CONCURRENCY + 10)
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=limits, timeout=60) as client:
+        token = await get_token(client)
+
+        baseline = await measure_shipments(client, token)
+        summarize("/shipments idle", baseline)
+
+        stop = asyncio.Event()
+        rate_limited = [0]
+        hammers = [asyncio.create_task(hammer_login(client, stop, rate_limited)) for _ in range(LOGIN_CONCURRENCY)]
+        try:
+            loaded = await measure_shipments(client, token)
+        finally:
+            stop.set()
+            await asyncio.gather(*hammers, return_exceptions=True)
+        summarize(f"/shipments with {LOGIN_CONCURRENCY} concurrent /token callers", loaded)
+        if rate_limited[0]:
+            print(f"Warning: {rate_limited[0]} /token calls were rate limited (429), so this did not measure "
+                  "bcrypt load; restart the app with RATE_LIMIT_ENABLED=false")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+
+# cd SCMXPertLite/backend
+# RATE_LIMIT_ENABLED=false uvicorn app:app
+# python benchmarks/password_pool_bench.py
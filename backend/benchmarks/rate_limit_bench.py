@@ -0,0 +1,79 @@
+# Benchmark: cost of rejecting rate-limited /token requests
+# Measures the limiter decision alone, then whole POST /token requests that
+# are rejected with 429, and compares both with one bcrypt verification
+# (what every unlimited attempt costs). Runs in-process; rejected requests
+# never reach MongoDB, so no server or database is needed.
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+import httpx
+from fastapi import HTTPException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import app as app_module  # noqa: E402
+
+BENCH_DECISIONS = int(os.getenv("BENCH_DECISIONS", 200000))
+BENCH_REQUESTS = int(os.getenv("BENCH_REQUESTS", 5000))
+BENCH_CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", 50))
+
+
+async def bench_decisions():
+    limiter = app_module.RateLimiter(app_module.MemoryRateLimitStore(app_module.RATE_LIMIT_MAX_KEYS))
+    rejected = 0
+    start = time.perf_counter()
+    for _ in range(BENCH_DECISIONS):
+        try:
+            await limiter.check("token", "203.0.113.7", "victim")
+        except HTTPException:
+            rejected += 1
+    elapsed = time.perf_counter() - start
+    print(f"Limiter decisions: {BENCH_DECISIONS} ({rejected} rejected), "
+          f"{elapsed / BENCH_DECISIONS * 1e6:.2f} us each, {BENCH_DECISIONS / elapsed:,.0f}/s")
+
+
+async def bench_requests():
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    transport = httpx.ASGITransport(app=app_module.app)
+    latencies = []
+    statuses = {}
+    remaining = BENCH_REQUESTS
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                response = await client.post("/token", data={"username": "victim", "password": "guess"})
+                latencies.append(time.perf_counter() - start)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        app_module.RATE_LIMIT_IP_BURST = 0  # Every measured request is a rejection
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(BENCH_CONCURRENCY)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Rejected POST /token: {len(latencies)} requests {statuses}, {len(latencies) / elapsed:,.0f} req/s, "
+          f"median {statistics.median(latencies) * 1e6:.0f} us, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.0f} us (concurrency {BENCH_CONCURRENCY})")
+
+
+def bench_bcrypt():
+    hashed = app_module.get_password_hash("bench_password")
+    start = time.perf_counter()
+    app_module.verify_password("guess", hashed)
+    print(f"One bcrypt verification: {(time.perf_counter() - start) * 1e6:,.0f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(bench_decisions())
+    asyncio.run(bench_requests())
+    bench_bcrypt()
+
+# cd SCMXPertLite/backend
+# python benchmarks/rate_limit_bench.py
@@ -0,0 +1,85 @@
+# Benchmark: serializing a page of shipments
+# Compares the default FastAPI path (pydantic Shipment per document, then
+# jsonable_encoder and json.dumps) with BSONResponse rendering the Mongo
+# documents directly. No server or database is needed.
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import app as app_module  # noqa: E402
+
+BENCH_SHIPMENTS = int(os.getenv("BENCH_SHIPMENTS", 10000))
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", 5))
+
+
+def make_docs():
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "item_name": f"Item {i}",
+            "quantity": random.randint(1, 500),
+            "description": "Synthetic shipment for serialization benchmarking",
+            "status": random.choice(["new", "In Transit", "Delivered"]),
+            "created_at": now - timedelta(seconds=i),
+            "goods_type": random.choice([None, "Electronics", "Pharma"]),
+            "user_id": f"user{i % 100}",
+        }
+        for i in range(BENCH_SHIPMENTS)
+    ]
+
+
+def pydantic_path(docs):
+    items = []
+    for doc in docs:
+        doc = dict(doc, id=str(doc["_id"]))
+        doc.pop("_id")
+        items.append(app_module.Shipment(**doc).dict())
+    page = app_module.ShipmentPage(items=items, next_cursor=None)
+    return json.dumps(jsonable_encoder(page)).encode("utf-8")
+
+
+def bson_path(docs):
+    items = []
+    for doc in docs:
+        doc = dict(doc, id=doc["_id"])
+        doc.pop("_id")
+        items.append(doc)
+    return app_module.BSONResponse({"items": items, "next_cursor": None}).body
+
+
+def run(name, fn, docs):
+    timings = []
+    for _ in range(BENCH_ROUNDS):
+        start = time.perf_counter()
+        body = fn(docs)
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    print(f"{name:<10} median {median * 1000:8.1f} ms  "
+          f"({BENCH_SHIPMENTS / median:,.0f} shipments/s, {len(body):,} bytes)")
+    return median, body
+
+
+def main():
+    docs = make_docs()
+    print(f"Serializing {BENCH_SHIPMENTS} shipments, {BENCH_ROUNDS} rounds "
+          f"(orjson {'available' if app_module.orjson else 'missing, using json'})")
+    slow, slow_body = run("pydantic", pydantic_path, docs)
+    fast, fast_body = run("bson", bson_path, docs)
+    assert json.loads(slow_body) == json.loads(fast_body), "Serialized payloads differ"
+    print(f"Speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
+
+# cd SCMXPertLite/backend
+# python benchmarks/serialization_bench.py
@@ -0,0 +1,132 @@
+# Benchmark: multi-worker startup and SIGTERM drain under gunicorn
+# Starts gunicorn.conf.py with and without PRELOAD_APP and reports how long
+# it takes until every worker has finished its lifespan startup, the memory
+# of master + workers (PSS, Linux only) and how long a SIGTERM takes to drain
+# and exit. Workers use a local mongod (--mongo-uri) or an in-memory mongomock
+# stand-in, in which case gunicorn loads this module as the app.
+import argparse
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_app():
+    if not os.getenv("MONGO_DETAILS"):
+        import motor.motor_asyncio
+        from mongomock_motor import AsyncMongoMockClient, AsyncMongoMockCollection
+
+        motor.motor_asyncio.AsyncIOMotorClient = lambda *a, **kw: AsyncMongoMockClient()
+        # mongomock has no write concerns and its with_options() returns a
+        # synchronous collection, so keep the async one
+        AsyncMongoMockCollection.with_options = lambda self, **kw: self
+    sys.path.insert(0, BACKEND_DIR)
+    import app as app_module
+    return app_module.app
+
+
+def pss_kb(pid):
+    # Proportional set size counts pages shared between forks only once in total
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("Pss:"))
+    except (OSError, StopIteration):
+        return None
+
+
+def child_pids(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
+
+
+def run_once(args, preload):
+    env = {**os.environ, "PRELOAD_APP": "true" if preload else "false", "WEB_CONCURRENCY": str(args.workers)}
+    if args.mongo_uri:
+        env["MONGO_DETAILS"] = args.mongo_uri
+        env.setdefault("MONGO_DB_NAME", "SCMXPertLite_startup_bench")
+    command = [sys.executable, "-m", "gunicorn", "--bind", f"127.0.0.1:{args.port}"]
+    if args.mongo_uri:
+        command.append("app:app")
+    else:
+        command += ["--pythonpath", os.path.join(BACKEND_DIR, "benchmarks"), "startup_bench:app"]
+
+    ready = threading.Event()
+    worker_ready_times = []
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, text=True)
+
+    def read_log():
+        for line in process.stderr:
+            if "Application startup complete" in line:
+                worker_ready_times.append(time.perf_counter() - start)
+                if len(worker_ready_times) == args.workers:
+                    ready.set()
+
+    reader = threading.Thread(target=read_log, daemon=True)
+    reader.start()
+    try:
+        if not ready.wait(args.timeout):
+            raise RuntimeError(f"Only {len(worker_ready_times)}/{args.workers} workers started in {args.timeout}s")
+        httpx.get(f"http://127.0.0.1:{args.port}/", timeout=10).raise_for_status()
+        pids = [process.pid] + child_pids(process.pid)
+        memory = [pss_kb(pid) for pid in pids]
+        total_pss_mb = sum(memory) / 1024 if None not in memory else None
+
+        drain_start = time.perf_counter()
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=args.timeout)
+        drain_seconds = time.perf_counter() - drain_start
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+    return {
+        "first_worker_ready_s": round(worker_ready_times[0], 3),
+        "all_workers_ready_s": round(worker_ready_times[-1], 3),
+        "total_pss_mb": round(total_pss_mb, 1) if total_pss_mb is not None else None,
+        "sigterm_exit_s": round(drain_seconds, 3),
+    }
+
+
+def median_of(runs, key):
+    values = [run[key] for run in runs if run[key] is not None]
+    return round(statistics.median(values), 3) if values else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure gunicorn multi-worker startup and shutdown")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--mongo-uri", help="Use a real mongod instead of mongomock")
+    args = parser.parse_args()
+
+    report = {"workers": args.workers, "rounds": args.rounds, "backend": "mongod" if args.mongo_uri else "mongomock"}
+    for preload in (False, True):
+        runs = [run_once(args, preload) for _ in range(args.rounds)]
+        report["preload" if preload else "no_preload"] = {
+            key: median_of(runs, key) for key in runs[0]
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
+else:
+    app = load_app()  # Loaded by gunicorn as startup_bench:app
+
+# cd SCMXPertLite/backend
+# python benchmarks/startup_bench.py --workers 4
@@ -0,0 +1,107 @@
+# Benchmark: sustained device telemetry ingestion rate
+# Run the app first (uvicorn app:app), then run this script against it.
+# BENCH_MODE is "http" (POST /devices/readings batches) or "ws" (WebSocket,
+# needs the websockets package). Readings are sent for a shipment of the
+# bench user, as the app only accepts readings for the sender's shipments.
+import asyncio
+import json
+import os
+import random
+import time
+from datetime import datetime
+
+import httpx
+
+BASE_URL = os.getenv("BENCH_BASE_URL", "http://127.0.0.1:8000")
+BENCH_MODE = os.getenv("BENCH_MODE", "http")
+BENCH_SECONDS = float(os.getenv("BENCH_SECONDS", 10))
+BENCH_CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", 8))
+BENCH_BATCH_SIZE = int(os.getenv("BENCH_BATCH_SIZE", 500))
+BENCH_DEVICES = int(os.getenv("BENCH_DEVICES", 100))
+BENCH_USER = {
+    "username": "bench_user",
+    "email": "bench_user@example.com",
+    "password": "bench_password",
+    "role": "user",
+}
+
+
+def make_batch(shipment_id):
+    return [
+        {
+            "device_id": f"DEV{random.randrange(BENCH_DEVICES):06d}",
+            "shipment_id": shipment_id,
+            "location": {"latitude": random.uniform(-90, 90), "longitude": random.uniform(-180, 180)},
+            "sensor_data": {"temperature": random.uniform(-5, 35), "humidity": random.uniform(20, 90)},
+        }
+        for _ in range(BENCH_BATCH_SIZE)
+    ]
+
+
+async def get_token(client):
+    await client.post("/signup", json=BENCH_USER)
+    response = await client.post(
+        "/token", data={"username": BENCH_USER["username"], "password": BENCH_USER["password"]}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def create_shipment(client, token):
+    response = await client.post("/shipments", headers={"Authorization": f"Bearer {token}"}, json={
+        "item_name": "Telemetry bench", "quantity": 1, "description": "Telemetry bench",
+        "status": "In Transit", "created_at": datetime.utcnow().isoformat(),
+    })
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def http_producer(client, token, shipment_id, deadline, counts):
+    headers = {"Authorization": f"Bearer {token}"}
+    while time.perf_counter() < deadline:
+        response = await client.post("/devices/readings", json=make_batch(shipment_id), headers=headers)
+        if response.status_code == 202:
+            counts["accepted"] += response.json()["accepted"]
+        else:
+            counts["rejected"] += BENCH_BATCH_SIZE
+
+
+async def ws_producer(token, shipment_id, deadline, counts):
+    import websockets
+
+    url = BASE_URL.replace("http", "ws", 1) + f"/devices/readings/ws?token={token}"
+    async with websockets.connect(url) as websocket:
+        while time.perf_counter() < deadline:
+            await websocket.send(json.dumps(make_batch(shipment_id)))
+            reply = json.loads(await websocket.recv())
+            counts["accepted"] += reply.get("accepted", 0)
+
+
+async def main():
+    counts = {"accepted": 0, "rejected": 0}
+    limits = httpx.Limits(max_connections=BENCH_CONCURRENCY + 2)
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=limits, timeout=60) as client:
+        token = await get_token(client)
+        shipment_id = await create_shipment(client, token)
+        start = time.perf_counter()
+        deadline = start + BENCH_SECONDS
+        if BENCH_MODE == "ws":
+            producers = [ws_producer(token, shipment_id, deadline, counts) for _ in range(BENCH_CONCURRENCY)]
+        else:
+            producers = [http_producer(client, token, shipment_id, deadline, counts) for _ in range(BENCH_CONCURRENCY)]
+        await asyncio.gather(*producers)
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"mode={BENCH_MODE} concurrency={BENCH_CONCURRENCY} batch={BENCH_BATCH_SIZE} "
+        f"accepted={counts['accepted']} rejected={counts['rejected']} "
+        f"readings/s={counts['accepted'] / elapsed:.0f}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+
+# cd SCMXPertLite/backend
+# uvicorn app:app
+# python benchmarks/telemetry_bench.py
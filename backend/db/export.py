@@ -1,14 +1,45 @@
 # code to export the schema and stored in .xls form in downloads folder
-import pandas as pd
-from pymongo import MongoClient
+# Data is streamed from MongoDB in batches and written incrementally, so
+# large collections never have to fit in memory. Supports xlsx (one workbook,
+# openpyxl write-only mode), csv and parquet (one file per collection,
+# exported in parallel) and a --since/--until time range for incremental runs.
+# Every stored field is exported unless --schema-fields limits the data
+# sheets to the fields documented in the schema sheets. Importing this module
+# is cheap and opens no connection, so app.py takes its collection list from
+# here.
+import argparse
+import csv
+import json
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+
+from bson import ObjectId
+from pymongo import MongoClient
 
 # MongoDB connection
-client = MongoClient('mongodb://localhost:27017/')
-db = client['SCMXpertLite']
+MONGO_URI = os.getenv("EXPORT_MONGO_URI", 'mongodb://localhost:27017/')
+MONGO_DB = os.getenv("EXPORT_MONGO_DB", 'SCMXpertLite')
+TELEMETRY_COLLECTION = os.getenv("TELEMETRY_COLLECTION", "device_readings")  # Same setting as app.py
+
+client = None
+db = None
+
+
+def get_db():
+    global client, db
+    if db is None:
+        client = MongoClient(MONGO_URI)
+        db = client[MONGO_DB]
+    return db
 
 # Define a function to retrieve collection schemas
 def get_collection_schema(collection_name):
+    import pandas as pd
+
     schema = {
         "Field Name": [],
         "Data Type": [],
@@ -126,6 +157,20 @@ def get_collection_schema(collection_name):
         schema["Key"] = ['Primary Key', '', 'Foreign Key', '', '', '']
         schema["Constraints/Validation"] = ['Auto-generated', 'Required, Unique', 'Links to Shipments collection', '', '', 'Auto-generated']
 
+    elif collection_name == 'DeviceReadings':
+        schema["Field Name"] = ['_id', 'device_id', 'shipment_id', 'location', 'sensor_data', 'timestamp']
+        schema["Data Type"] = ['ObjectId', 'String', 'ObjectId', 'Object', 'Object', 'DateTime']
+        schema["Description"] = [
+            'Unique identifier for each reading',
+            'Device that sent the reading',
+            'Reference to the shipment the device travels with',
+            'GeoJSON point where the reading was taken',
+            'Sensor values (e.g., temperature, humidity)',
+            'Time of the reading (time of receipt if the device sent none)'
+        ]
+        schema["Key"] = ['Primary Key', '', 'Foreign Key', '', '', '']
+        schema["Constraints/Validation"] = ['Auto-generated', 'Required', 'Links to Shipments collection, Optional', 'Optional', 'Required', 'Required']
+
     elif collection_name == 'Sessions':
         schema["Field Name"] = ['_id', 'user_id', 'jwt_token', 'expires_at']
         schema["Data Type"] = ['ObjectId', 'ObjectId', 'String', 'DateTime']
@@ -176,29 +221,200 @@ def get_collection_schema(collection_name):
 
     # Check if all lists are the same length
     lengths = {len(v) for v in schema.values()}
-    print(f"Lengths for {collection_name}: {[len(v) for v in schema.values()]}")
     if len(lengths) > 1:
         raise ValueError(f"Inconsistent lengths in schema for collection '{collection_name}'.")
 
     return pd.DataFrame(schema)
 
+# Sheet name -> (MongoDB collection, field used for --since/--until)
+COLLECTIONS = {
+    'Users': ('users', 'created_at'),
+    'Shipments': ('shipments', 'created_at'),
+    'Devices': ('devices', 'timestamp'),
+    'DeviceReadings': (TELEMETRY_COLLECTION, 'timestamp'),
+    'Sessions': ('sessions', 'expires_at'),
+    'Roles': ('roles', None),
+    'ShipmentTrackingLogs': ('shipment_tracking_logs', 'timestamp'),
+    'BatchShipments': ('batch_shipments', 'created_at'),
+}
+
 # Create a list of collection names
-collection_names = ['Users', 'Shipments', 'Devices', 'Sessions', 'Roles', 'ShipmentTrackingLogs', 'BatchShipments']
+collection_names = list(COLLECTIONS)
+
+BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 5000))
+log_lock = threading.Lock()
 
 # Path to save the Excel file in Downloads folder
 downloads_folder = os.path.join(os.path.expanduser("~"), "Downloads")
 file_path = os.path.join(downloads_folder, 'SCMXpertLite_Schema_and_Data.xlsx')
 
-# Initialize an Excel writer
-with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-    for collection in collection_names:
+
+def to_cell(value):
+    # Convert BSON values into something xlsx/csv/parquet can store
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def log(message):
+    # Collections export in parallel threads; one write per line keeps lines whole
+    with log_lock:
+        sys.stdout.write(message + "\n")
+        sys.stdout.flush()
+
+
+def field_names(mongo_name, query, schema_fields):
+    """Every field used by the matching documents, schema fields first."""
+    pipeline = [
+        {"$match": query},
+        {"$project": {"fields": {"$objectToArray": "$$ROOT"}}},
+        {"$unwind": "$fields"},
+        {"$group": {"_id": "$fields.k"}},
+    ]
+    names = {group["_id"] for group in get_db()[mongo_name].aggregate(pipeline, allowDiskUse=True)}
+    return [field for field in schema_fields if field in names] + sorted(names - set(schema_fields))
+
+
+def iter_batches(collection, schema_fields_only=False, since=None, until=None):
+    """Yield (columns, rows) for each batch of documents in the collection."""
+    mongo_name, time_field = COLLECTIONS[collection]
+    schema_fields = list(get_collection_schema(collection)["Field Name"])
+
+    query = {}
+    if time_field and (since or until):
+        query[time_field] = {}
+        if since:
+            query[time_field]["$gte"] = since
+        if until:
+            query[time_field]["$lt"] = until
+
+    if schema_fields_only:
+        columns = schema_fields
+        projection = {field: 1 for field in schema_fields}
+    else:
+        # Columns are fixed before streaming, so collect every field name up
+        # front (server side) instead of trusting the first batch
+        columns = field_names(mongo_name, query, schema_fields)
+        projection = None
+    cursor = get_db()[mongo_name].find(query, projection).batch_size(BATCH_SIZE)
+
+    while True:
+        docs = list(islice(cursor, BATCH_SIZE))
+        if not docs:
+            break
+        yield columns, [[to_cell(doc.get(column)) for column in columns] for doc in docs]
+
+
+def export_xlsx(path, collections, schema_fields_only=False, since=None, until=None):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    for collection in collections:
         # Export schema
         schema_df = get_collection_schema(collection)
-        schema_df.to_excel(writer, sheet_name=f"{collection}_Schema", index=False)
+        schema_sheet = workbook.create_sheet(f"{collection}_Schema")
+        schema_sheet.append(list(schema_df.columns))
+        for row in schema_df.itertuples(index=False):
+            schema_sheet.append(list(row))
+
+        # Export data; the sheet is only created if the collection has data
+        data_sheet = None
+        count = 0
+        for columns, rows in iter_batches(collection, schema_fields_only, since, until):
+            if data_sheet is None:
+                data_sheet = workbook.create_sheet(f"{collection}_Data")
+                data_sheet.append(columns)
+            for row in rows:
+                data_sheet.append(row)
+            count += len(rows)
+        log(f"Exported {count} documents from {collection}")
+    workbook.save(path)
+
+
+def export_collection_file(output_dir, collection, fmt, schema_fields_only=False, since=None, until=None):
+    get_collection_schema(collection).to_csv(os.path.join(output_dir, f"{collection}_Schema.csv"), index=False)
+
+    path = os.path.join(output_dir, f"{collection}_Data.{fmt}")
+    count = 0
+    if fmt == "csv":
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            for columns, rows in iter_batches(collection, schema_fields_only, since, until):
+                if count == 0:
+                    writer.writerow(columns)
+                writer.writerows(rows)
+                count += len(rows)
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for columns, rows in iter_batches(collection, schema_fields_only, since, until):
+                if writer is None:
+                    # Fix the schema from the first batch; DateTime fields keep
+                    # their type, everything else is written as strings
+                    schema_df = get_collection_schema(collection)
+                    types = dict(zip(schema_df["Field Name"], schema_df["Data Type"]))
+                    arrow_schema = pa.schema([
+                        (column, pa.timestamp("ms") if types.get(column) == "DateTime" else pa.string())
+                        for column in columns
+                    ])
+                    writer = pq.ParquetWriter(path, arrow_schema)
+                data = {
+                    column: [
+                        value if value is None or types.get(column) == "DateTime" else str(value)
+                        for value in values
+                    ]
+                    for column, values in zip(columns, zip(*rows))
+                }
+                writer.write_table(pa.Table.from_pydict(data, schema=arrow_schema))
+                count += len(rows)
+        finally:
+            if writer is not None:
+                writer.close()
+    log(f"Exported {count} documents from {collection} to {path}")
+    return path
+
+
+def export(fmt="xlsx", output=None, collections=None, workers=4, schema_fields_only=False, since=None, until=None):
+    collections = collections or collection_names
+    if fmt == "xlsx":
+        path = output or file_path
+        export_xlsx(path, collections, schema_fields_only, since, until)
+        return path
+
+    output_dir = output or downloads_folder
+    os.makedirs(output_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(export_collection_file, output_dir, collection, fmt, schema_fields_only, since, until)
+            for collection in collections
+        ]
+        for future in futures:
+            future.result()
+    return output_dir
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export SCMXpertLite schema and data")
+    parser.add_argument("--format", choices=["xlsx", "csv", "parquet"], default="xlsx")
+    parser.add_argument("--output", help="Output file (xlsx) or directory (csv/parquet)")
+    parser.add_argument("--collections", nargs="+", choices=collection_names, help="Collections to export")
+    parser.add_argument("--workers", type=int, default=4, help="Collections exported in parallel (csv/parquet)")
+    parser.add_argument("--schema-fields", action="store_true",
+                        help="Only export the fields documented in the schema sheets (default: every field)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Only export documents from this time (ISO 8601)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Only export documents before this time (ISO 8601)")
+    return parser.parse_args()
+
 
-        # Export data
-        data_df = pd.DataFrame(list(db[collection].find({})))  # Fetch all data from the collection
-        if not data_df.empty:  # Check if the collection has data
-            data_df.to_excel(writer, sheet_name=f"{collection}_Data", index=False)
+if __name__ == "__main__":
+    args = parse_args()
+    path = export(args.format, args.output, args.collections, args.workers, args.schema_fields, args.since, args.until)
+    print(f"Schema and data exported to {path}")
 
-print(f"Schema and data exported to {file_path}")
+# cd SCMXPertLite/backend/db
+# python export.py --format csv --since 2024-01-01
@@ -0,0 +1,43 @@
+# code to convert stored {latitude, longitude} locations to GeoJSON points
+# 2dsphere indexes need GeoJSON ({"type": "Point", "coordinates": [lng, lat]});
+# a plain {latitude, longitude} document would be read as [latitude, longitude].
+# Also fills shipments.last_location from each shipment's latest tracking log.
+# Safe to re-run: only documents still in the old shape are touched.
+import os
+
+from pymongo import MongoClient
+
+# MongoDB connection
+MONGO_URI = os.getenv("MIGRATE_MONGO_URI", 'mongodb://localhost:27017/')
+MONGO_DB = os.getenv("MIGRATE_MONGO_DB", 'SCMXPertLite')
+
+client = MongoClient(MONGO_URI)
+db = client[MONGO_DB]
+
+to_geojson = [{"$set": {"location": {
+    "type": "Point",
+    "coordinates": ["$location.longitude", "$location.latitude"]
+}}}]
+
+for collection in ['devices', 'shipment_tracking_logs', 'device_readings']:
+    result = db[collection].update_many({"location.latitude": {"$exists": True}}, to_geojson)
+    print(f"Converted {result.modified_count} locations in {collection}")
+
+# Latest located tracking log per shipment -> shipments.last_location
+latest_positions = db['shipment_tracking_logs'].aggregate([
+    {"$match": {"location.type": "Point"}},
+    {"$sort": {"shipment_id": 1, "timestamp": -1}},
+    {"$group": {"_id": "$shipment_id", "location": {"$first": "$location"}, "timestamp": {"$first": "$timestamp"}}},
+], allowDiskUse=True)
+
+updated = 0
+for position in latest_positions:
+    result = db['shipments'].update_one(
+        {"_id": position["_id"], "last_location": {"$exists": False}},
+        {"$set": {"last_location": position["location"], "last_location_at": position["timestamp"]}}
+    )
+    updated += result.modified_count
+print(f"Set last_location on {updated} shipments")
+
+# cd SCMXPertLite/backend/db
+# python migrate_locations.py
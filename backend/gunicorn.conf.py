@@ -0,0 +1,49 @@
+# Production server: gunicorn managing uvicorn workers
+# Workers share nothing: each opens its own MongoDB pool and runs its own
+# caches and background tasks from the app's lifespan, so anything shared
+# (SECRET_KEY, MONGO_*, ...) must come from the environment. With
+# PRELOAD_APP the master imports the app (reading those settings once) and
+# loads the static files before forking, so workers skip the import and share
+# that memory copy-on-write. On SIGTERM gunicorn stops accepting connections;
+# each worker finishes in-flight requests for up to GRACEFUL_TIMEOUT minus
+# SHUTDOWN_RESERVE_SECONDS, then its lifespan shutdown flushes telemetry and
+# closes the Motor client. Open SSE streams are cut at that point and
+# EventSource clients reconnect to another worker.
+import os
+
+try:
+    from uvicorn_worker import UvicornWorker
+except ImportError:
+    from uvicorn.workers import UvicornWorker  # Deprecated in newer uvicorn releases
+
+wsgi_app = "app:app"
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))  # One event loop per core
+preload_app = os.getenv("PRELOAD_APP", "true").lower() == "true"
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+timeout = int(os.getenv("WORKER_TIMEOUT", 60))  # Workers that miss heartbeats this long are restarted
+keepalive = int(os.getenv("KEEPALIVE", 5))
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+# Left for the lifespan shutdown once draining stops
+SHUTDOWN_RESERVE_SECONDS = 5
+
+
+class DrainingUvicornWorker(UvicornWorker):
+    CONFIG_KWARGS = {
+        **UvicornWorker.CONFIG_KWARGS,
+        "timeout_graceful_shutdown": max(graceful_timeout - SHUTDOWN_RESERVE_SECONDS, 1),
+    }
+
+
+worker_class = DrainingUvicornWorker
+
+
+def when_ready(server):
+    if preload_app:
+        import app
+        app.static_files.preload()  # Workers inherit the cache instead of each reading the files
+    server.log.info("Starting %d workers (preload_app=%s)", workers, preload_app)
+
+# cd SCMXPertLite/backend
+# gunicorn